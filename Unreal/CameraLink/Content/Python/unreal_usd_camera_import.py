@@ -8,8 +8,71 @@ This is called automatically by the CameraLink C++ plugin when you select a USD
 """
 
 import os
+import pathlib
+import traceback
+
 import unreal
 
+# Cache of parsed USD metadata keyed by (abs_file_path, mtime_ns, size).
+# Stage opens compose every sublayer and dominate import time for large files,
+# so repeated imports of an unchanged file should not pay that cost twice.
+_METADATA_CACHE = {}
+
+# Whether a successful import pops the sequence open in Sequencer. Batch
+# importers can flip this off - rebuilding the Sequencer panel per file
+# is one of the most expensive editor operations an import triggers.
+OPEN_SEQUENCE_ON_IMPORT = True
+
+# Step-by-step narration is useful when debugging an import and noise the
+# rest of the time - and every gated call skips its f-string formatting as
+# well as the log call. Errors, warnings and the result banner always log.
+_VERBOSE = os.environ.get("CAMERALINK_VERBOSE", "0") == "1"
+
+# Cached pxr modules - importing pxr repeatedly re-runs module lookup on
+# every call site, and the first import is expensive (plugin registry init)
+_PXR_MODULES = None
+
+
+def _get_pxr():
+    """
+    Import the pxr USD modules once and cache them.
+
+    Returns the (Sdf, Usd, UsdGeom) tuple, or None if the USD plugins
+    are not available in this Unreal Python environment.
+    """
+    global _PXR_MODULES
+    if _PXR_MODULES is None:
+        try:
+            from pxr import Sdf, Usd, UsdGeom
+            _PXR_MODULES = (Sdf, Usd, UsdGeom)
+        except ImportError:
+            _PXR_MODULES = False
+    return _PXR_MODULES or None
+
+
+# Cached editor subsystem handle - get_editor_subsystem walks the engine's
+# subsystem registry on every call, and the handle is stable for the session
+_EDITOR_SUBSYSTEM = None
+
+
+def _get_editor_subsystem():
+    """Look up the UnrealEditorSubsystem once and reuse the handle."""
+    global _EDITOR_SUBSYSTEM
+    if _EDITOR_SUBSYSTEM is None:
+        _EDITOR_SUBSYSTEM = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
+    return _EDITOR_SUBSYSTEM
+
+
+def invalidate_metadata_cache():
+    """
+    Clear the cached USD metadata.
+
+    Call this when a file is rewritten mid-session without a new import
+    (e.g. the USD Stage Editor Reload workflow described in the import log).
+    """
+    _METADATA_CACHE.clear()
+
+
 def import_camera(file_path: str):
     """
     Import USD camera with animation into Unreal.
@@ -24,62 +87,101 @@ def import_camera(file_path: str):
         unreal.log_error("[CameraLink] No file path provided!")
         return None
     
-    # Normalize path with forward slashes
-    file_path = file_path.replace("\\", "/")
-    abs_file_path = os.path.abspath(file_path)
+    # Normalize once up front: absolute, collapsed, forward slashes
+    # (USD and Unreal both want /) - everything downstream reuses this.
+    # The file dialog always hands us absolute paths, so only pay
+    # abspath's getcwd() syscall for the rare relative one
+    if not os.path.isabs(file_path):
+        file_path = os.path.abspath(file_path)
+    abs_file_path = pathlib.PurePath(os.path.normpath(file_path)).as_posix()
     
-    if not os.path.exists(abs_file_path):
+    # One stat covers the existence check, the size sanity check, and the
+    # metadata cache fingerprint below
+    try:
+        st = os.stat(abs_file_path)
+    except OSError:
         unreal.log_error(f"[CameraLink] File not found: {abs_file_path}")
         return None
-    
-    unreal.log("=" * 60)
-    unreal.log("[CameraLink] Starting camera import")
-    unreal.log(f"[CameraLink] File: {abs_file_path}")
-    
-    # Get file size to verify it has animation data
-    file_size = os.path.getsize(abs_file_path)
-    unreal.log(f"[CameraLink] File size: {file_size} bytes")
-    if file_size < 1000:
+
+    unreal.log("=" * 60 + f"\n[CameraLink] Starting camera import\n[CameraLink] File: {abs_file_path}")
+
+    # File size hints whether there is animation data at all
+    if _VERBOSE:
+        unreal.log(f"[CameraLink] File size: {st.st_size} bytes")
+    if st.st_size < 1000:
         unreal.log_warning("[CameraLink] File seems small - may not contain animation data")
-    
+
     # Read USD metadata first
-    metadata = _read_usd_metadata(abs_file_path)
+    metadata = _read_usd_metadata(abs_file_path, stat_result=st)
     
     # Import via stage actor
     result = _import_via_stage_actor(abs_file_path, metadata)
     
     if result and result.get("success"):
-        unreal.log("=" * 60)
-        unreal.log("[CameraLink] SUCCESS - Camera imported")
+        # Each unreal.log call crosses the Python/C++ boundary and takes the
+        # log lock separately - build the banner once and log it in one call
+        lines = [
+            "=" * 60,
+            "[CameraLink] SUCCESS - Camera imported",
+        ]
         if result.get("has_animation"):
             seq_name = result.get("level_sequence").get_name() if result.get("level_sequence") else "Unknown"
-            unreal.log(f"[CameraLink] Animation: frames {metadata.get('start_frame', '?')}-{metadata.get('end_frame', '?')} @ {metadata.get('fps', '?')}fps")
-            unreal.log(f"[CameraLink] Level Sequence: {seq_name} (transient)")
-            unreal.log("")
-            unreal.log("[CameraLink] TO RENDER WITH USD CAMERA (live-linked):")
-            unreal.log(f"[CameraLink]   1. Open '{seq_name}' sequence")
-            unreal.log("[CameraLink]   2. Add Camera Cut track → set to imported camera")
-            unreal.log("[CameraLink]   3. Add other animation/subsequences INTO this sequence")
-            unreal.log("[CameraLink]   4. Render from this sequence")
-            unreal.log("")
-            unreal.log("[CameraLink] TO CONVERT TO NATIVE UNREAL (for use in other sequences):")
-            unreal.log("[CameraLink]   1. Select UsdStageActor in Outliner")
-            unreal.log("[CameraLink]   2. USD Stage Editor → Actions → Import")
-            unreal.log("[CameraLink]   3. This creates a native CineCameraActor + saved sequence")
-            unreal.log("")
-            unreal.log("[CameraLink] TO UPDATE FROM MAYA:")
-            unreal.log("[CameraLink]   1. Export updated camera from Maya")
-            unreal.log("[CameraLink]   2. Select UsdStageActor → USD Stage Editor → Reload")
-            unreal.log("[CameraLink]   NOTE: Reload removes any manually added tracks/actors")
-        unreal.log("=" * 60)
-    
+            lines += [
+                f"[CameraLink] Animation: frames {metadata.get('start_frame', '?')}-{metadata.get('end_frame', '?')} @ {metadata.get('fps', '?')}fps",
+                f"[CameraLink] Level Sequence: {seq_name} (transient)",
+                "",
+                "[CameraLink] TO RENDER WITH USD CAMERA (live-linked):",
+                f"[CameraLink]   1. Open '{seq_name}' sequence",
+                "[CameraLink]   2. Add Camera Cut track → set to imported camera",
+                "[CameraLink]   3. Add other animation/subsequences INTO this sequence",
+                "[CameraLink]   4. Render from this sequence",
+                "",
+                "[CameraLink] TO CONVERT TO NATIVE UNREAL (for use in other sequences):",
+                "[CameraLink]   1. Select UsdStageActor in Outliner",
+                "[CameraLink]   2. USD Stage Editor → Actions → Import",
+                "[CameraLink]   3. This creates a native CineCameraActor + saved sequence",
+                "",
+                "[CameraLink] TO UPDATE FROM MAYA:",
+                "[CameraLink]   1. Export updated camera from Maya",
+                "[CameraLink]   2. Select UsdStageActor → USD Stage Editor → Reload",
+                "[CameraLink]   NOTE: Reload removes any manually added tracks/actors",
+            ]
+        lines.append("=" * 60)
+        unreal.log("\n".join(lines))
+
     return result
 
 
-def _read_usd_metadata(file_path: str):
+def import_cameras(file_paths):
+    """
+    Import several camera USD files in one call.
+
+    Runs import_camera per file but keeps Sequencer closed until the
+    last import, so a batch pays one Sequencer open (an editor-tick and
+    UI layout hit) instead of one per file. Returns the per-file result
+    dicts in input order.
+    """
+    global OPEN_SEQUENCE_ON_IMPORT
+
+    file_paths = list(file_paths)
+    results = []
+    open_on_import = OPEN_SEQUENCE_ON_IMPORT
+    try:
+        for index, file_path in enumerate(file_paths):
+            OPEN_SEQUENCE_ON_IMPORT = open_on_import and index == len(file_paths) - 1
+            results.append(import_camera(file_path))
+    finally:
+        OPEN_SEQUENCE_ON_IMPORT = open_on_import
+    return results
+
+
+def _read_usd_metadata(file_path: str, stat_result=None):
     """
     Read animation metadata from USD file.
     Returns dict with has_animation, start_frame, end_frame, fps.
+
+    Callers that already stat'ed the file (import_camera does, for its
+    existence and size checks) can pass the result to skip a repeat stat.
     """
     metadata = {
         "has_animation": False,
@@ -87,73 +189,207 @@ def _read_usd_metadata(file_path: str):
         "end_frame": 120,
         "fps": 24
     }
-    
+
+    # Check the cache first - fingerprinted on mtime (nanosecond) plus
+    # size so a re-exported file is re-read even if the filesystem's
+    # timestamp granularity hides a fast overwrite
+    if stat_result is None:
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            # File missing/unreadable - bail before paying for the pxr import
+            # or a layer parse that can only fail
+            unreal.log_warning(f"[CameraLink] Cannot stat file for metadata: {file_path}")
+            return metadata
+
+    cache_key = (file_path, stat_result.st_mtime_ns, stat_result.st_size)
+    if cache_key in _METADATA_CACHE:
+        if _VERBOSE:
+            unreal.log("[CameraLink] Using cached USD metadata (file unchanged)")
+        return _METADATA_CACHE[cache_key]
+
+    pxr = _get_pxr()
+    if pxr is None:
+        unreal.log_warning("[CameraLink] pxr module not available - cannot read metadata")
+        unreal.log_warning("[CameraLink] Will import camera but may not have correct timing")
+        return metadata
+    Sdf, Usd, UsdGeom = pxr
+
     try:
-        from pxr import Sdf, Usd, UsdGeom
-        
-        stage = Usd.Stage.Open(file_path)
-        if not stage:
-            unreal.log_warning("[CameraLink] Could not open stage for metadata")
+        # Timing metadata and customLayerData both live on the root layer,
+        # so read them straight off the Sdf.Layer - composing a stage is
+        # only needed if we end up scanning prims for time samples below
+        root_layer = Sdf.Layer.FindOrOpen(file_path)
+        if not root_layer:
+            unreal.log_warning("[CameraLink] Could not open layer for metadata")
             return metadata
-        
-        # Read USD stage-level timing metadata
-        usd_fps = stage.GetTimeCodesPerSecond()
-        usd_start = stage.GetStartTimeCode()
-        usd_end = stage.GetEndTimeCode()
-        
-        unreal.log(f"[CameraLink] USD Stage Metadata:")
-        unreal.log(f"  timeCodesPerSecond: {usd_fps}")
-        unreal.log(f"  startTimeCode: {usd_start}")
-        unreal.log(f"  endTimeCode: {usd_end}")
-        
+
+        # Read USD layer-level timing metadata
+        usd_fps = root_layer.timeCodesPerSecond
+        usd_start = root_layer.startTimeCode
+        usd_end = root_layer.endTimeCode
+
+        if _VERBOSE:
+            unreal.log("[CameraLink] USD Layer Metadata:\n"
+                       f"  timeCodesPerSecond: {usd_fps}\n"
+                       f"  startTimeCode: {usd_start}\n"
+                       f"  endTimeCode: {usd_end}")
+
         # Check for CameraLink custom metadata
-        root_layer = stage.GetRootLayer()
         custom_data = root_layer.customLayerData or {}
-        
+
         if custom_data.get("cameralink_has_animation"):
-            unreal.log("[CameraLink] Found CameraLink custom metadata")
+            if _VERBOSE:
+                unreal.log("[CameraLink] Found CameraLink custom metadata")
             metadata["has_animation"] = True
             metadata["start_frame"] = custom_data.get("cameralink_start_frame", metadata["start_frame"])
             metadata["end_frame"] = custom_data.get("cameralink_end_frame", metadata["end_frame"])
             metadata["fps"] = custom_data.get("cameralink_fps", metadata["fps"])
         else:
-            # Fallback: check for time samples on prims
-            unreal.log("[CameraLink] No custom metadata, scanning for time samples...")
+            # Fallback: check for time samples on camera prims.
+            # Only cameras matter to this importer, so skip everything else,
+            # and use GetNumTimeSamples/bracketing queries instead of
+            # GetTimeSamples() - the latter materializes the full sample list
+            # just to read its length and endpoints.
+            if _VERBOSE:
+                unreal.log("[CameraLink] No custom metadata, scanning cameras for time samples...")
+
+            # Only now do we pay for stage composition. The Maya exporter
+            # authors cameras under /cameras, so mask population to that
+            # subtree; composition then skips every other prim in the file.
+            # LoadNone additionally skips payload loading.
+            mask = Usd.StagePopulationMask(["/cameras"])
+            stage = Usd.Stage.OpenMasked(file_path, mask, load=Usd.Stage.LoadNone)
+            if stage and not stage.GetPseudoRoot().GetChildren():
+                # Not a CameraLink export - compose the full stage so the
+                # scan can still find cameras authored elsewhere
+                stage = Usd.Stage.Open(file_path, load=Usd.Stage.LoadNone)
+            if not stage:
+                unreal.log_warning("[CameraLink] Could not open stage for metadata")
+                return metadata
+
             for prim in stage.Traverse():
-                if prim.IsA(UsdGeom.Xformable):
-                    xformable = UsdGeom.Xformable(prim)
-                    for op in xformable.GetOrderedXformOps():
-                        times = op.GetTimeSamples()
-                        if times and len(times) > 1:
-                            metadata["has_animation"] = True
-                            metadata["start_frame"] = min(times)
-                            metadata["end_frame"] = max(times)
-                            metadata["fps"] = usd_fps if usd_fps else 24
-                            unreal.log(f"[CameraLink] Found animation from time samples: {len(times)} samples")
-                            break
-                    if metadata["has_animation"]:
+                if not prim.IsA(UsdGeom.Camera):
+                    continue
+                xformable = UsdGeom.Xformable(prim)
+                for op in xformable.GetOrderedXformOps():
+                    # ValueMightBeTimeVarying answers "definitely static?"
+                    # without visiting every contributing layer, so static
+                    # ops bail here before the exact count is computed
+                    attr = op.GetAttr()
+                    if not attr.ValueMightBeTimeVarying():
+                        continue
+                    num_samples = op.GetNumTimeSamples()
+                    if num_samples > 1:
+                        # Bracketing at +/-inf returns the first/last sample
+                        # without allocating the whole vector (on the
+                        # attribute - XformOp doesn't expose bracketing)
+                        first, _ = attr.GetBracketingTimeSamples(-1e308)
+                        _, last = attr.GetBracketingTimeSamples(1e308)
+                        metadata["has_animation"] = True
+                        metadata["start_frame"] = first
+                        metadata["end_frame"] = last
+                        metadata["fps"] = usd_fps if usd_fps else 24
+                        if _VERBOSE:
+                            unreal.log(f"[CameraLink] Found animation from time samples: {num_samples} samples")
                         break
+                if metadata["has_animation"]:
+                    break
         
-        unreal.log(f"[CameraLink] Final Metadata: animation={metadata['has_animation']}, "
-                   f"frames={metadata['start_frame']}-{metadata['end_frame']}, fps={metadata['fps']}")
-        
-    except ImportError:
-        unreal.log_warning("[CameraLink] pxr module not available - cannot read metadata")
-        unreal.log_warning("[CameraLink] Will import camera but may not have correct timing")
+        if _VERBOSE:
+            unreal.log(f"[CameraLink] Final Metadata: animation={metadata['has_animation']}, "
+                       f"frames={metadata['start_frame']}-{metadata['end_frame']}, fps={metadata['fps']}")
+
+        _METADATA_CACHE[cache_key] = metadata
+
     except Exception as e:
         unreal.log_warning(f"[CameraLink] Could not read metadata: {e}")
     
     return metadata
 
 
+# Whether UsdStageActor.root_layer expects the FilePath struct form; probed
+# once on the first import and reused so we never dispatch via exceptions
+_ROOT_LAYER_IS_STRUCT = None
+
+# Probed once at module load: whether LevelSequence exposes the direct
+# rate setters. A hasattr probe here beats discovering the answer via a
+# raised AttributeError on every import.
+_HAS_RATE_SETTERS = hasattr(unreal.LevelSequence, "set_display_rate")
+
+
+def _apply_metadata_to_sequence(level_sequence, metadata: dict):
+    """
+    Configure the sequence's frame rate and ranges from USD metadata.
+
+    All setters share one transaction/modify (see chunk0-12); the rate
+    setter variant is dispatched off the module-load probe, not a
+    try/except cascade.
+    """
+    fps = int(metadata.get("fps", 24))
+    start_frame = int(metadata.get("start_frame", 1))
+    end_frame = int(metadata.get("end_frame", 120))
+
+    if _VERBOSE:
+        unreal.log(f"[CameraLink] Configuring sequence: {start_frame}-{end_frame} @ {fps}fps")
+
+    # Group all the setters into one transaction with a single
+    # modify() - otherwise each call snapshots the sequence for
+    # undo separately
+    with unreal.ScopedEditorTransaction("CameraLink: Configure Sequence"):
+        level_sequence.modify()
+
+        frame_rate = unreal.FrameRate(numerator=fps, denominator=1)
+        if _HAS_RATE_SETTERS:
+            level_sequence.set_display_rate(frame_rate)
+            level_sequence.set_tick_resolution(frame_rate)
+        else:
+            level_sequence.set_editor_property("display_rate", frame_rate)
+            level_sequence.set_editor_property("tick_resolution", frame_rate)
+
+        level_sequence.set_playback_start(start_frame)
+        level_sequence.set_playback_end(end_frame)
+
+        # Set view range with padding
+        level_sequence.set_view_range_start(float(start_frame - 10))
+        level_sequence.set_view_range_end(float(end_frame + 10))
+
+        # Set working range to match playback
+        level_sequence.set_work_range_start(float(start_frame))
+        level_sequence.set_work_range_end(float(end_frame))
+
+    unreal.log(f"[CameraLink] ✓ Sequence configured: {start_frame}-{end_frame} @ {fps}fps")
+
+
+def _set_stage_actor_root(stage_actor, file_path: str):
+    """
+    Point the stage actor's root_layer at file_path.
+
+    root_layer is a FilePath struct on current engine versions but was a
+    plain string on older ones. Probe the property's actual type once
+    (look-before-you-leap - a routinely raised exception costs far more
+    than a type check) and cache the answer at module scope so subsequent
+    imports dispatch directly.
+    """
+    global _ROOT_LAYER_IS_STRUCT
+    if _ROOT_LAYER_IS_STRUCT is None:
+        current = stage_actor.get_editor_property("root_layer")
+        _ROOT_LAYER_IS_STRUCT = not isinstance(current, str)
+
+    if _ROOT_LAYER_IS_STRUCT:
+        stage_actor.set_editor_property("root_layer", {"file_path": file_path})
+    else:
+        stage_actor.set_editor_property("root_layer", file_path)
+
+
 def _import_via_stage_actor(file_path: str, metadata: dict):
     """
     Import USD via UsdStageActor - ALWAYS creates new actor (like LayoutLink).
     User manually reloads existing actors via USD Stage Editor.
     """
     try:
-        # Get world
-        editor = unreal.get_editor_subsystem(unreal.UnrealEditorSubsystem)
+        # Get world (subsystem handle is cached at module scope)
+        editor = _get_editor_subsystem()
         world = editor.get_editor_world()
         
         if not world:
@@ -177,54 +413,50 @@ def _import_via_stage_actor(file_path: str, metadata: dict):
         # Set descriptive label (like LayoutLink uses "MayaLayoutImport")
         base_name = os.path.splitext(os.path.basename(file_path))[0]
         stage_actor.set_actor_label(f"CameraLink_{base_name}")
-        unreal.log(f"[CameraLink] Spawned UsdStageActor: {stage_actor.get_name()}")
-        
-        # Set the root layer
-        stage_actor.set_editor_property("root_layer", {"file_path": file_path})
-        stage_actor.set_editor_property("time", 1.0)
-        
-        unreal.log("[CameraLink] Root layer set successfully")
-        
+
+        # Tag the actor so CameraLink stage actors can be found through the
+        # engine's tag index (unreal.GameplayStatics.get_all_actors_with_tag)
+        # instead of a linear get_all_level_actors() scan comparing labels
+        stage_actor.set_editor_property("tags", ["CameraLink"])
+
+        if _VERBOSE:
+            unreal.log(f"[CameraLink] Spawned UsdStageActor: {stage_actor.get_name()}")
+
+        # Set the root layer. No explicit "time" set afterwards: writing the
+        # property forces a stage resync on the game thread, and the default
+        # of 0.0 already shows the first-sample pose (USD holds values
+        # outside the sampled range)
+        _set_stage_actor_root(stage_actor, file_path)
+
+        if _VERBOSE:
+            unreal.log("[CameraLink] Root layer set successfully")
+
         # Setup Level Sequence for animation
         level_sequence = None
         has_animation = metadata.get("has_animation", False)
-        
+
         if has_animation:
-            unreal.log("[CameraLink] Setting up animation...")
-            
             # Get the Level Sequence that USD Stage Actor automatically creates
             level_sequence = stage_actor.get_editor_property("level_sequence")
-            
+
             if level_sequence:
-                unreal.log(f"[CameraLink] Found Level Sequence: {level_sequence.get_name()}")
-                
+                if _VERBOSE:
+                    unreal.log(f"[CameraLink] Found Level Sequence: {level_sequence.get_name()}")
+
                 # Configure timing
-                fps = int(metadata.get("fps", 24))
-                start_frame = int(metadata.get("start_frame", 1))
-                end_frame = int(metadata.get("end_frame", 120))
-                
-                unreal.log(f"[CameraLink] Configuring sequence: {start_frame}-{end_frame} @ {fps}fps")
-                
-                frame_rate = unreal.FrameRate(numerator=fps, denominator=1)
-                level_sequence.set_display_rate(frame_rate)
-                level_sequence.set_tick_resolution(frame_rate)
-                
-                level_sequence.set_playback_start(start_frame)
-                level_sequence.set_playback_end(end_frame)
-                
-                # Set view range with padding
-                level_sequence.set_view_range_start(float(start_frame - 10))
-                level_sequence.set_view_range_end(float(end_frame + 10))
-                
-                # Set working range to match playback
-                level_sequence.set_work_range_start(float(start_frame))
-                level_sequence.set_work_range_end(float(end_frame))
-                
-                unreal.log(f"[CameraLink] ✓ Sequence configured: {start_frame}-{end_frame} @ {fps}fps")
-                
-                # Open in Sequencer
-                unreal.LevelSequenceEditorBlueprintLibrary.open_level_sequence(level_sequence)
-                unreal.log(f"[CameraLink] Opened Level Sequence: {level_sequence.get_path_name()}")
+                _apply_metadata_to_sequence(level_sequence, metadata)
+
+                # Open in Sequencer - unless it is already the focused
+                # sequence (reopening rebuilds the whole panel for nothing)
+                # or the caller opted out for batch imports
+                if OPEN_SEQUENCE_ON_IMPORT:
+                    seq_lib = unreal.LevelSequenceEditorBlueprintLibrary
+                    if seq_lib.get_current_level_sequence() != level_sequence:
+                        seq_lib.open_level_sequence(level_sequence)
+                        if _VERBOSE:
+                            unreal.log(f"[CameraLink] Opened Level Sequence: {level_sequence.get_path_name()}")
+                    elif _VERBOSE:
+                        unreal.log("[CameraLink] Level Sequence already open in Sequencer")
                 
             else:
                 unreal.log_warning("[CameraLink] Animation detected but no Level Sequence found!")
@@ -241,7 +473,6 @@ def _import_via_stage_actor(file_path: str, metadata: dict):
         
     except Exception as e:
         unreal.log_error(f"[CameraLink] Import failed: {e}")
-        import traceback
         unreal.log(traceback.format_exc())
         return {"success": False, "error": str(e)}
 
@@ -259,19 +490,32 @@ def print_usd_debug(file_path: str):
         return
     
     file_path = file_path.replace("\\", "/")
-    
+
+    pxr = _get_pxr()
+    if pxr is None:
+        unreal.log_error("[CameraLink Debug] pxr module not available")
+        return
+    Sdf, Usd, UsdGeom = pxr
+
     try:
-        from pxr import Usd, UsdGeom
-        
-        stage = Usd.Stage.Open(file_path)
+        # Find() hits the in-memory layer registry, so running this right
+        # after import_camera (the usual debug workflow) reuses the layer
+        # the metadata read already parsed instead of re-reading the file
+        root_layer = Sdf.Layer.Find(file_path) or Sdf.Layer.FindOrOpen(file_path)
+        if not root_layer:
+            unreal.log_error("[CameraLink Debug] Could not open layer")
+            return
+
+        # Compose without pulling payloads - a structure report doesn't
+        # need them, and camera exports never author any
+        stage = Usd.Stage.Open(root_layer, load=Usd.Stage.LoadNone)
         if not stage:
             unreal.log_error("[CameraLink Debug] Could not open stage")
             return
-        
+
         unreal.log("=" * 60)
         unreal.log("[CameraLink Debug] File structure:")
-        
-        root_layer = stage.GetRootLayer()
+
         custom_data = root_layer.customLayerData or {}
         if custom_data:
             unreal.log(f"  Custom metadata: {custom_data}")
@@ -284,26 +528,29 @@ def print_usd_debug(file_path: str):
             if prim.IsA(UsdGeom.Xformable):
                 xformable = UsdGeom.Xformable(prim)
                 for op in xformable.GetOrderedXformOps():
-                    times = op.GetTimeSamples()
-                    if times:
-                        unreal.log(f"      Transform op '{op.GetOpName()}': {len(times)} time samples")
-                        if len(times) <= 5:
-                            unreal.log(f"        Frames: {times}")
+                    # Ask for the count first - GetTimeSamples() would
+                    # materialize the full sample vector just for this report
+                    num_samples = op.GetNumTimeSamples()
+                    if num_samples:
+                        unreal.log(f"      Transform op '{op.GetOpName()}': {num_samples} time samples")
+                        if num_samples <= 5:
+                            unreal.log(f"        Frames: {op.GetTimeSamples()}")
                         else:
-                            unreal.log(f"        Frames: {times[0]} ... {times[-1]}")
-            
+                            # Bracketing is an attribute-level query
+                            attr = op.GetAttr()
+                            first, _ = attr.GetBracketingTimeSamples(-1e308)
+                            _, last = attr.GetBracketingTimeSamples(1e308)
+                            unreal.log(f"        Frames: {first} ... {last}")
+
             if prim.IsA(UsdGeom.Camera):
                 camera = UsdGeom.Camera(prim)
                 focal_attr = camera.GetFocalLengthAttr()
-                times = focal_attr.GetTimeSamples()
-                if times:
-                    unreal.log(f"      FocalLength: {len(times)} time samples")
+                num_samples = focal_attr.GetNumTimeSamples()
+                if num_samples:
+                    unreal.log(f"      FocalLength: {num_samples} time samples")
         
         unreal.log("=" * 60)
-        
-    except ImportError:
-        unreal.log_error("[CameraLink Debug] pxr module not available")
+
     except Exception as e:
         unreal.log_error(f"[CameraLink Debug] Error: {e}")
-        import traceback
         unreal.log(traceback.format_exc())
\ No newline at end of file
@@ -1,35 +1,198 @@
 import maya.cmds as mc
 import maya.mel as mel
-from PySide6 import QtWidgets, QtCore, QtGui
-from shiboken6 import wrapInstance
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
 import maya.OpenMayaUI as omui
+import math
 import os
+import pathlib
 
 try:
-    from pxr import Usd, UsdGeom, Sdf
+    from pxr import Gf, Usd, UsdGeom, Sdf
 except ImportError:
     mc.error("USD Python libraries not found. Make sure Maya USD plugin is loaded.")
 
 def get_maya_main_window():
     """Get Maya main window as a Qt widget."""
+    from PySide6 import QtWidgets
+    from shiboken6 import wrapInstance
     main_window_ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(int(main_window_ptr), QtWidgets.QWidget)
 
+# Characters that are invalid in a USD prim name (Maya DAG separators,
+# namespace colons, and filesystem-style punctuation), all mapped to '_'.
+# A translate table does the cleanup in one C-level pass instead of a
+# str.replace per character.
+_INVALID_NAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*. '})
+
+def _sanitize_name(name):
+    """Make a Maya node name (possibly a long DAG path) safe as a USD prim name.
+
+    Keeps just the leaf name with its namespace stripped - a long path
+    like '|set|rig:camMain' becomes 'camMain', not a wall of underscores.
+    """
+    return name.split('|')[-1].split(':')[-1].translate(_INVALID_NAME_TABLE)
+
+# Maya film apertures are in inches; USD wants millimeters
+_IN_TO_MM = 25.4
+
+# Maya time-unit tokens mapped to FPS - module-level so the table is
+# built once, not per query
+_FPS_MAP = {
+    'game': 15.0, 'film': 24.0, 'pal': 25.0, 'ntsc': 30.0,
+    'show': 48.0, 'palf': 50.0, 'ntscf': 60.0,
+    '23.976fps': 23.976, '29.97fps': 29.97, '29.97df': 29.97,
+    '47.952fps': 47.952, '59.94fps': 59.94,
+}
+
+# Arbitrary '<n>fps' tokens parsed once, then served from here
+_FPS_SUFFIX_CACHE = {}
+
+def _get_maya_fps():
+    """Current scene frame rate, resolved from the time-unit token.
+
+    Straight dict lookup for the standard units; custom '<n>fps' units
+    are parsed on first sight and cached. Unrecognized tokens fall back
+    to the MEL helper.
+    """
+    unit = mc.currentUnit(query=True, time=True)
+    fps = _FPS_MAP.get(unit)
+    if fps is not None:
+        return fps
+
+    fps = _FPS_SUFFIX_CACHE.get(unit)
+    if fps is None:
+        if unit.endswith('fps'):
+            try:
+                fps = float(unit[:-3])
+            except ValueError:
+                fps = float(mel.eval('currentTimeUnitToFPS()'))
+        else:
+            fps = float(mel.eval('currentTimeUnitToFPS()'))
+        _FPS_SUFFIX_CACHE[unit] = fps
+    return fps
+
+# Animation checks cached per node name - UI refreshes and exports may
+# probe the same nodes repeatedly, and every probe is a Maya command
+_ANIMATION_CACHE = {}
+
+# Incoming connections that never drive a value over time - layer and set
+# membership show up on most transforms. Anything NOT in this list counts
+# as animated: pairBlend, motionPath, rivets, custom rig nodes... a false
+# positive only costs the single-sample shortcut, a false negative would
+# silently bake a moving camera as one static pose.
+_STATIC_SOURCE_TYPES = frozenset((
+    'displayLayer',
+    'renderLayer',
+    'renderLayerManager',
+    'objectSet',
+    'shadingEngine',
+    'partition',
+    'hyperLayout',
+))
+
+def _is_animated(node):
+    """Return True if node has incoming connections that can drive it over time.
+
+    One unfiltered listConnections per node, filtered by node type in
+    Python, instead of a separate filtered query per attribute. Results
+    are cached by name; the cache is cleared at the start of each export.
+    """
+    cached = _ANIMATION_CACHE.get(node)
+    if cached is not None:
+        return cached
+
+    sources = mc.listConnections(node, source=True, destination=False, plugs=False) or []
+    animated = False
+    for src in sources:
+        if mc.nodeType(src) not in _STATIC_SOURCE_TYPES:
+            animated = True
+            break
+
+    _ANIMATION_CACHE[node] = animated
+    return animated
+
+def _is_camera_animated(camera_name):
+    """Return True if the camera's world transform can change over time.
+
+    Checks the transform and every ancestor - animation on a parent group
+    moves the camera just as much as keys on the camera itself.
+    """
+    long_name = mc.ls(camera_name, long=True)[0]
+    path = ''
+    for part in long_name.split('|')[1:]:
+        path += '|' + part
+        if _is_animated(path):
+            return True
+    return False
+
+def _anim_curve_for_plug(plug):
+    """Return the MFnAnimCurve feeding plug directly, or None.
+
+    A plug driven by exactly one anim curve can be sampled with a spline
+    lookup instead of a DG evaluation; constrained or expression-driven
+    plugs return None and keep the full evaluation path.
+    """
+    if not plug.isDestination:
+        return None
+    src = plug.source().node()
+    if src.hasFn(om.MFn.kAnimCurve):
+        return oma.MFnAnimCurve(src)
+    return None
+
+def _collapse_repeated(samples):
+    """Drop the interior samples of constant runs in a {frame: value} dict.
+
+    Keeping only each run's endpoints reproduces the plateau exactly under
+    USD's linear interpolation while skipping the flat stretches that
+    dominate most lens tracks (a rack focus is a short ramp between two
+    long holds). Ramps are untouched: any frame whose neighbours differ
+    survives.
+    """
+    if len(samples) < 3:
+        return samples
+    frames = list(samples)
+    collapsed = {frames[0]: samples[frames[0]]}
+    for prev, cur, nxt in zip(frames, frames[1:], frames[2:]):
+        if not (samples[prev] == samples[cur] == samples[nxt]):
+            collapsed[cur] = samples[cur]
+    collapsed[frames[-1]] = samples[frames[-1]]
+    return collapsed
+
+def _write_time_samples(layer, attr, samples):
+    """Write a {frame: value} dict of time samples straight into the layer.
+
+    Sdf.Layer.SetTimeSample bypasses the schema validation and value
+    coercion UsdAttribute.Set repeats per call - the specs are already
+    created and typed by the schema accessors before any writes happen.
+    Binding the method once keeps the per-sample cost to a single
+    Python->C++ crossing.
+    """
+    set_sample = layer.SetTimeSample
+    path = attr.GetPath()
+    for frame, value in samples.items():
+        set_sample(path, frame, value)
+
 def export_camera_to_usd(camera_name, output_path, frame_range):
-    """Export camera animation to USD using separate TRS operations (matches LayoutLink)."""
+    """Export camera animation to USD as a single matrix transform op."""
     start_frame, end_frame = frame_range
     
     # Get Maya's current frame rate
-    maya_fps = mel.eval('currentTimeUnitToFPS()')
+    maya_fps = _get_maya_fps()
     
-    # Get Maya's linear unit for focus distance conversion to cm
+    # The OpenMaya API reads distances in Maya's internal unit (cm)
+    # regardless of UI unit, which matches the stage's metersPerUnit=0.01;
+    # the UI unit is only queried for the export report
     linear_unit = mc.currentUnit(query=True, linear=True)
-    unit_to_cm = {'mm': 0.1, 'cm': 1.0, 'm': 100.0, 'in': 2.54, 'ft': 30.48, 'yd': 91.44}
-    cm_scale = unit_to_cm.get(linear_unit, 1.0)
     
-    # Ensure .usda extension (ASCII format)
-    if not output_path.endswith('.usda'):
-        output_path = output_path.rsplit('.', 1)[0] + '.usda'
+    # Default to binary crate (.usdc) - ASCII inflates long animations
+    # 3-5x in size and save time. An explicit .usda request is honored for
+    # anyone who wants a readable file. Normalize separators in the same
+    # pathlib pass - USD asset paths want forward slashes.
+    path = pathlib.PurePath(output_path)
+    if path.suffix not in ('.usda', '.usdc'):
+        path = path.with_suffix('.usdc')
+    output_path = path.as_posix()
     
     # Remove existing file if it exists (USD CreateNew fails on existing files)
     if os.path.exists(output_path):
@@ -40,7 +203,7 @@ def export_camera_to_usd(camera_name, output_path, frame_range):
             mc.error(f"Could not remove existing file: {e}")
             return None
     
-    # Create USD stage in ASCII format
+    # Create USD stage - format is picked from the extension
     stage = Usd.Stage.CreateNew(output_path)
     
     # Set scene metadata AND timing metadata (CRITICAL for Unreal!)
@@ -53,14 +216,23 @@ def export_camera_to_usd(camera_name, output_path, frame_range):
     stage.SetStartTimeCode(start_frame)
     stage.SetEndTimeCode(end_frame)
     
-    # Create camera prim
-    camera_path = f"/cameras/{camera_name}"
+    # Create camera prim (sanitized - Maya names can carry '|' and ':')
+    camera_path = f"/cameras/{_sanitize_name(camera_name)}"
     camera_prim = UsdGeom.Camera.Define(stage, camera_path)
+
+    # Resolve the USD attribute handles once through the schema accessors;
+    # name-based GetAttribute() lookups repeat a string hash and schema
+    # registry walk per call
+    usd_attrs = {
+        'focalLength': camera_prim.CreateFocalLengthAttr(),
+        'horizontalAperture': camera_prim.CreateHorizontalApertureAttr(),
+        'verticalAperture': camera_prim.CreateVerticalApertureAttr(),
+        'focusDistance': camera_prim.CreateFocusDistanceAttr(),
+        'fStop': camera_prim.CreateFStopAttr()
+    }
     
-    # Store transform samples (SEPARATE TRS like LayoutLink)
-    translate_samples = {}
-    rotate_samples = {}
-    scale_samples = {}
+    # Store transform samples (one world matrix per frame)
+    matrix_samples = {}
     
     # Store camera attribute samples
     attr_samples = {
@@ -76,71 +248,159 @@ def export_camera_to_usd(camera_name, output_path, frame_range):
     render_height = mc.getAttr("defaultResolution.height")
     target_aspect = render_width / render_height
     print(f"  - Render resolution: {render_width}x{render_height} (aspect: {target_aspect:.4f})")
-    
-    # Sample at every frame
-    for frame in range(int(start_frame), int(end_frame) + 1):
-        mc.currentTime(frame)
-        
-        # Get SEPARATE transform components (like LayoutLink)
-        translation = mc.xform(camera_name, query=True, worldSpace=True, translation=True)
-        rotation = mc.xform(camera_name, query=True, worldSpace=True, rotation=True)
-        scale = mc.xform(camera_name, query=True, worldSpace=True, scale=True)
-        
-        translate_samples[frame] = (translation[0], translation[1], translation[2])
-        rotate_samples[frame] = (rotation[0], rotation[1], rotation[2])
-        scale_samples[frame] = (scale[0], scale[1], scale[2])
-        
-        # Get camera attributes
-        shape = mc.listRelatives(camera_name, shapes=True)[0]
-        attr_samples['focalLength'][frame] = mc.getAttr(f"{shape}.focalLength")
-        
-        # Get Maya's film aperture values for reference
-        maya_h_aperture = mc.getAttr(f"{shape}.horizontalFilmAperture") * 25.4
-        maya_v_aperture = mc.getAttr(f"{shape}.verticalFilmAperture") * 25.4
-        
-        # For matching FOV between Maya and Unreal:
-        # Use standard 36mm horizontal aperture (full-frame 35mm standard)
-        # Derive vertical aperture from render resolution aspect ratio
-        # This ensures consistent FOV match regardless of Maya's filmback settings
-        h_aperture = 36.0  # Standard full-frame horizontal aperture in mm
-        v_aperture = h_aperture / target_aspect  # Derive from render aspect
-        
-        attr_samples['horizontalAperture'][frame] = h_aperture
-        attr_samples['verticalAperture'][frame] = v_aperture
-        
-        # Focus distance - convert from Maya's linear unit to cm for USD
-        attr_samples['focusDistance'][frame] = mc.getAttr(f"{shape}.focusDistance") * cm_scale
-        attr_samples['fStop'][frame] = mc.getAttr(f"{shape}.fStop")
-    
-    # Write SEPARATE transform ops (MATCH LAYOUTLINK EXACTLY)
+
+    # Resolve the camera once through the OpenMaya API - each cmds query
+    # in the loop would re-parse its MEL-style arguments and re-walk the
+    # DAG, where MDagPath/MFnCamera reads are direct C++ calls
+    sel = om.MSelectionList()
+    sel.add(camera_name)
+    cam_dag = sel.getDagPath(0)
+    shape_dag = om.MDagPath(cam_dag).extendToShape()
+    cam_fn = om.MFnCamera(shape_dag)
+
+    # Get Maya's film aperture values for reference (API reports inches)
+    maya_h_aperture = cam_fn.horizontalFilmAperture * _IN_TO_MM
+    maya_v_aperture = cam_fn.verticalFilmAperture * _IN_TO_MM
+
+    # Work out what actually animates (stale results would be worse than
+    # the re-probe, so clear the per-node cache for this export)
+    _ANIMATION_CACHE.clear()
+    xform_animated = _is_camera_animated(camera_name)
+    optics_animated = _is_animated(shape_dag.partialPathName())
+
+    # For matching FOV between Maya and Unreal:
+    # Use standard 36mm horizontal aperture (full-frame 35mm standard)
+    # Derive vertical aperture from render resolution aspect ratio
+    # This ensures consistent FOV match regardless of Maya's filmback settings
+    h_aperture = 36.0  # Standard full-frame horizontal aperture in mm
+    v_aperture = h_aperture / target_aspect  # Derive from render aspect
+
+    # Plugs for time-scoped evaluation. Reading through an MDGContext
+    # evaluates only what these plugs pull on; stepping mc.currentTime
+    # would re-evaluate the entire dependency graph (rigs, deformers, ...)
+    # once per frame just to sample one camera
+    xform_fn = om.MFnDependencyNode(cam_dag.node())
+    world_matrix_plug = xform_fn.findPlug('worldMatrix', False).elementByLogicalIndex(
+        cam_dag.instanceNumber())
+    shape_fn = om.MFnDependencyNode(shape_dag.node())
+    focal_plug = shape_fn.findPlug('focalLength', False)
+    focus_plug = shape_fn.findPlug('focusDistance', False)
+    fstop_plug = shape_fn.findPlug('fStop', False)
+
+    # Lens plugs keyed directly on an anim curve get sampled with a spline
+    # lookup in the frame loop - no DG dirty propagation at all; anything
+    # else (constraints, expressions) keeps the context-scoped read
+    focal_curve = _anim_curve_for_plug(focal_plug)
+    focus_curve = _anim_curve_for_plug(focus_plug)
+    fstop_curve = _anim_curve_for_plug(fstop_plug)
+
+    time_unit = om.MTime.uiUnit()
+
+    # A fully static camera carries the same information in one sample as
+    # in N - skip the bake and write a single pose instead of bloating
+    # the file (and Unreal's parse time) with identical samples
+    # Round-half-up rather than truncate: timeline queries can hand back
+    # 23.9999... for frame 24, and int() would silently drop a frame
+    first_frame_i = math.floor(start_frame + 0.5)
+    last_frame_i = math.floor(end_frame + 0.5)
+    if xform_animated or optics_animated:
+        # Materialized once; integer frames are reused verbatim as USD
+        # time codes, so no per-iteration arithmetic or float conversion
+        sample_frames = list(range(first_frame_i, last_frame_i + 1))
+    else:
+        print("  - Static camera: baking a single sample")
+        sample_frames = (first_frame_i,)
+
+    # Static optics need exactly one read - don't re-query three lens
+    # plugs per frame just to collect identical values
+    if not optics_animated:
+        first_frame = first_frame_i
+        with om.MDGContextGuard(om.MDGContext(om.MTime(first_frame, time_unit))):
+            attr_samples['focalLength'][first_frame] = focal_plug.asDouble()
+            attr_samples['focusDistance'][first_frame] = focus_plug.asDouble()
+            attr_samples['fStop'][first_frame] = fstop_plug.asDouble()
+        attr_samples['horizontalAperture'][first_frame] = h_aperture
+        attr_samples['verticalAperture'][first_frame] = v_aperture
+
+    # Sample the frames (keep the loop body free of per-frame guards;
+    # validation happened above)
+    for frame in sample_frames:
+        # Evaluate the plugs at this frame without touching scene time;
+        # only the plugs that actually need a DG pull go through the guard
+        mtime = om.MTime(frame, time_unit)
+        with om.MDGContextGuard(om.MDGContext(mtime)):
+            world_mobj = world_matrix_plug.asMObject()
+            if optics_animated:
+                if focal_curve is None:
+                    focal_length = focal_plug.asDouble()
+                if focus_curve is None:
+                    focus_distance = focus_plug.asDouble()
+                if fstop_curve is None:
+                    f_stop = fstop_plug.asDouble()
+
+        # Curve-driven lens values come straight off the spline
+        if optics_animated:
+            if focal_curve is not None:
+                focal_length = focal_curve.evaluate(mtime)
+            if focus_curve is not None:
+                focus_distance = focus_curve.evaluate(mtime)
+            if fstop_curve is not None:
+                f_stop = fstop_curve.evaluate(mtime)
+
+        # World matrix straight into the Gf type the op stores - Maya and
+        # USD share the row-vector convention, so no decomposition and no
+        # Euler conversion are needed at all
+        m = om.MFnMatrixData(world_mobj).matrix()
+        matrix_samples[frame] = Gf.Matrix4d(*[m[i] for i in range(16)])
+
+        # Camera attributes from the curve/plug reads above (skipped
+        # entirely for static optics - those were captured once already).
+        # Focus distance reads report internal units (cm), as USD wants.
+        if optics_animated:
+            attr_samples['focalLength'][frame] = focal_length
+            attr_samples['horizontalAperture'][frame] = h_aperture
+            attr_samples['verticalAperture'][frame] = v_aperture
+            attr_samples['focusDistance'][frame] = focus_distance
+            attr_samples['fStop'][frame] = f_stop
+    
+    # Author ONE matrix transform op - a third of the sample stores and
+    # file size of the old Translate/RotateXYZ/Scale triple
     xformable = UsdGeom.Xformable(camera_prim)
     xformable.ClearXformOpOrder()
-    
-    # Create transform ops in the same order as LayoutLink
-    translate_op = xformable.AddTranslateOp()
-    rotate_op = xformable.AddRotateXYZOp()
-    scale_op = xformable.AddScaleOp()
-    
-    # Write all transform samples as timeSamples (using frame number directly)
-    for frame, value in translate_samples.items():
-        translate_op.Set(value, frame)
-    
-    for frame, value in rotate_samples.items():
-        rotate_op.Set(value, frame)
-    
-    for frame, value in scale_samples.items():
-        scale_op.Set(value, frame)
-    
-    # Write camera attribute samples
-    for attr_name, samples in attr_samples.items():
-        attr = camera_prim.GetPrim().GetAttribute(attr_name)
-        for frame, value in samples.items():
-            attr.Set(value, frame)
-    
-    # Add metadata to root layer (CameraLink metadata keys)
+    xform_op = xformable.AddTransformOp()
+
     root_layer = stage.GetRootLayer()
+
+    # Coalesce change notification for the whole write phase - every set
+    # otherwise fires a notice that stage observers (Maya's own USD
+    # machinery included) process per sample. Sample tracks go through
+    # the Sdf layer directly, which also keeps the block Sdf-pure.
+    with Sdf.ChangeBlock():
+        # Write transform samples as timeSamples (using frame number
+        # directly); a static transform becomes one default value, not a
+        # sample track
+        if xform_animated:
+            # Held poses (a camera parked between moves, or locked off
+            # with only the lens keyed) collapse the same way as lens
+            # plateaus - Gf.Matrix4d compares componentwise
+            _write_time_samples(root_layer, xform_op.GetAttr(),
+                                _collapse_repeated(matrix_samples))
+        else:
+            xform_op.Set(next(iter(matrix_samples.values())))
+
+        # Write camera attribute samples, same policy; repeated values are
+        # collapsed to run endpoints first - lens attrs sampled alongside
+        # an animated transform are usually flat for most of the range
+        for attr_name, samples in attr_samples.items():
+            attr = usd_attrs[attr_name]
+            if optics_animated:
+                _write_time_samples(root_layer, attr, _collapse_repeated(samples))
+            else:
+                attr.Set(next(iter(samples.values())))
+
+    # Add metadata to root layer (CameraLink metadata keys)
     custom_data = {
-        'cameralink_has_animation': True,
+        'cameralink_has_animation': bool(xform_animated or optics_animated),
         'cameralink_start_frame': start_frame,
         'cameralink_end_frame': end_frame,
         'cameralink_fps': maya_fps,
@@ -158,226 +418,309 @@ def export_camera_to_usd(camera_name, output_path, frame_range):
     print(f"  - Camera: {camera_name}")
     print(f"  - Frame range: {start_frame} to {end_frame}")
     print(f"  - Maya FPS: {maya_fps}")
-    print(f"  - Maya linear unit: {linear_unit} (scale to cm: {cm_scale})")
+    print(f"  - Maya linear unit: {linear_unit} (API samples are cm)")
+    print(f"  - Animated: transform={xform_animated}, optics={optics_animated}")
     print(f"  - Maya aperture: {maya_h_aperture:.2f}mm x {maya_v_aperture:.2f}mm")
     print(f"  - Export aperture: {h_aperture:.2f}mm x {v_aperture:.2f}mm (16:9 adjusted)")
     print(f"  - Render resolution: {render_width}x{render_height}")
     
     return output_path
 
-class CameraLinkUI(QtWidgets.QWidget):
-    """Main UI for CameraLink Maya plugin."""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setObjectName("CameraLinkWidget")
-        self.setWindowTitle("CameraLink - Export Camera")
-        self.selected_camera = None
-        self.setup_ui()
-        self.load_timeline_range()
-    
-    def setup_ui(self):
-        """Create the user interface."""
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #555;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QPushButton {
-                padding: 5px;
-                border-radius: 3px;
-            }
-        """)
-        
-        # Main layout
-        main_layout = QtWidgets.QVBoxLayout(self)
-        main_layout.setContentsMargins(10, 10, 10, 10)
-        main_layout.setSpacing(10)
-        
-        # Title
-        title = QtWidgets.QLabel("📹 CameraLink - Export Camera")
-        title.setAlignment(QtCore.Qt.AlignCenter)
-        title_font = QtGui.QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        main_layout.addWidget(title)
-        
-        # Camera Selection Group
-        camera_group = QtWidgets.QGroupBox("📷 Camera Selection")
-        camera_layout = QtWidgets.QVBoxLayout()
-        
-        select_layout = QtWidgets.QHBoxLayout()
-        self.select_camera_btn = QtWidgets.QPushButton("Select Camera")
-        self.select_camera_btn.setStyleSheet("background-color: rgb(179, 138, 188); color: black;")
-        self.select_camera_btn.clicked.connect(self.select_camera)
-        select_layout.addWidget(self.select_camera_btn)
-        
-        self.camera_label = QtWidgets.QLabel("No camera selected")
-        select_layout.addWidget(self.camera_label)
-        camera_layout.addLayout(select_layout)
-        
-        camera_group.setLayout(camera_layout)
-        main_layout.addWidget(camera_group)
-        
-        # Frame Range Group
-        range_group = QtWidgets.QGroupBox("🎬 Frame Range")
-        range_layout = QtWidgets.QVBoxLayout()
-        
-        # FPS info display
-        fps_label = QtWidgets.QLabel()
-        fps_label.setText("Please set desired frame range in the Maya timeline.")
-        fps_label.setStyleSheet("color: #888; font-style: italic;")
-        range_layout.addWidget(fps_label)
-        
-        # Start frame
-        start_layout = QtWidgets.QHBoxLayout()
-        start_layout.addWidget(QtWidgets.QLabel("Start Frame:"))
-        self.start_frame = QtWidgets.QSpinBox()
-        self.start_frame.setRange(-999999, 999999)
-        self.start_frame.setValue(1)
-        start_layout.addWidget(self.start_frame)
-        range_layout.addLayout(start_layout)
-        
-        # End frame
-        end_layout = QtWidgets.QHBoxLayout()
-        end_layout.addWidget(QtWidgets.QLabel("End Frame:"))
-        self.end_frame = QtWidgets.QSpinBox()
-        self.end_frame.setRange(-999999, 999999)
-        self.end_frame.setValue(100)
-        end_layout.addWidget(self.end_frame)
-        range_layout.addLayout(end_layout)
-        
-        # Get from timeline button
-        timeline_btn = QtWidgets.QPushButton("⏱️ Get from Timeline")
-        timeline_btn.setStyleSheet("background-color: rgb(179, 138, 188); color: black;")
-        timeline_btn.clicked.connect(self.load_timeline_range)
-        range_layout.addWidget(timeline_btn)
-        
-        range_group.setLayout(range_layout)
-        main_layout.addWidget(range_group)
-        
-        # Output File Group
-        output_group = QtWidgets.QGroupBox("💾 Output File")
-        output_layout = QtWidgets.QVBoxLayout()
-        
-        file_layout = QtWidgets.QHBoxLayout()
-        self.output_path = QtWidgets.QLineEdit()
-        self.output_path.setPlaceholderText("Select output path...")
-        file_layout.addWidget(self.output_path)
-        
-        browse_btn = QtWidgets.QPushButton("Browse...")
-        browse_btn.setStyleSheet("background-color: rgb(179, 138, 188); color: black;")
-        browse_btn.clicked.connect(self.browse_output)
-        file_layout.addWidget(browse_btn)
-        output_layout.addLayout(file_layout)
-        
-        output_group.setLayout(output_layout)
-        main_layout.addWidget(output_group)
-        
-        # Export Button
-        export_btn = QtWidgets.QPushButton("🚀 Export Camera to USDA")
-        export_btn.setMinimumHeight(40)
-        export_btn.setStyleSheet("background-color: rgb(96, 201, 80); color: black; font-weight: bold;")
-        export_btn.clicked.connect(self.export_camera)
-        main_layout.addWidget(export_btn)
-        
-        # Status label
-        self.status_label = QtWidgets.QLabel("")
-        self.status_label.setAlignment(QtCore.Qt.AlignCenter)
-        self.status_label.setWordWrap(True)
-        main_layout.addWidget(self.status_label)
-        
-        # Add stretch at bottom
-        main_layout.addStretch()
-    
-    def select_camera(self):
-        """Select camera from scene selection."""
-        selection = mc.ls(selection=True, cameras=False, transforms=True)
-        
-        if not selection:
-            self.status_label.setText("❌ Please select a camera in the scene")
-            self.status_label.setStyleSheet("color: red;")
-            return
-        
-        # Check if selected object has a camera shape
-        shapes = mc.listRelatives(selection[0], shapes=True, type='camera')
-        if not shapes:
-            self.status_label.setText("❌ Selected object is not a camera")
-            self.status_label.setStyleSheet("color: red;")
-            return
-        
-        self.selected_camera = selection[0]
-        self.camera_label.setText(f"Camera: {self.selected_camera}")
-        self.status_label.setText("✓ Camera selected")
-        self.status_label.setStyleSheet("color: green;")
-        
-        mc.inViewMessage(amg=f"Camera set: {self.selected_camera}", pos='topCenter', fade=True)
-    
-    def load_timeline_range(self):
-        """Load frame range from Maya timeline."""
-        start = int(mc.playbackOptions(query=True, minTime=True))
-        end = int(mc.playbackOptions(query=True, maxTime=True))
-        self.start_frame.setValue(start)
-        self.end_frame.setValue(end)
+_UI_CLASS = None
+
+def _get_ui_class():
+    """Build (once) and return the CameraLinkUI class.
+
+    Qt is only needed when the UI is actually shown - batch/headless
+    exports that just call export_camera_to_usd should not pay the
+    PySide6/shiboken import cost, so the class is defined lazily here.
+    """
+    global _UI_CLASS
+    if _UI_CLASS is not None:
+        return _UI_CLASS
+
+    from PySide6 import QtWidgets, QtCore, QtGui
+
+    class CameraLinkUI(QtWidgets.QWidget):
+        """Main UI for CameraLink Maya plugin."""
+    
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self.setObjectName("CameraLinkWidget")
+            self.setWindowTitle("CameraLink - Export Camera")
+            self.selected_camera = None
+            self._camera_list_cache = None
+            self.setup_ui()
+            self.populate_cameras()
+            self.load_timeline_range()
+    
+        def setup_ui(self):
+            """Create the user interface."""
+            self.setStyleSheet("""
+                QGroupBox {
+                    font-weight: bold;
+                    border: 2px solid #555;
+                    border-radius: 5px;
+                    margin-top: 10px;
+                    padding-top: 10px;
+                }
+                QGroupBox::title {
+                    subcontrol-origin: margin;
+                    left: 10px;
+                    padding: 0 5px;
+                }
+                QPushButton {
+                    padding: 5px;
+                    border-radius: 3px;
+                }
+            """)
+        
+            # Main layout
+            main_layout = QtWidgets.QVBoxLayout(self)
+            main_layout.setContentsMargins(10, 10, 10, 10)
+            main_layout.setSpacing(10)
+        
+            # Title
+            title = QtWidgets.QLabel("📹 CameraLink - Export Camera")
+            title.setAlignment(QtCore.Qt.AlignCenter)
+            title_font = QtGui.QFont()
+            title_font.setPointSize(12)
+            title_font.setBold(True)
+            title.setFont(title_font)
+            main_layout.addWidget(title)
+        
+            # Camera Selection Group
+            camera_group = QtWidgets.QGroupBox("📷 Camera Selection")
+            camera_layout = QtWidgets.QVBoxLayout()
+        
+            combo_layout = QtWidgets.QHBoxLayout()
+            combo_layout.addWidget(QtWidgets.QLabel("Camera:"))
+            self.camera_combo = QtWidgets.QComboBox()
+            self.camera_combo.currentTextChanged.connect(self.camera_chosen)
+            combo_layout.addWidget(self.camera_combo, 1)
+
+            refresh_btn = QtWidgets.QPushButton("⟳")
+            refresh_btn.setStyleSheet("background-color: rgb(179, 138, 188); color: black;")
+            refresh_btn.setMaximumWidth(30)
+            refresh_btn.clicked.connect(self.populate_cameras)
+            combo_layout.addWidget(refresh_btn)
+            camera_layout.addLayout(combo_layout)
+
+            select_layout = QtWidgets.QHBoxLayout()
+            self.select_camera_btn = QtWidgets.QPushButton("Select Camera")
+            self.select_camera_btn.setStyleSheet("background-color: rgb(179, 138, 188); color: black;")
+            self.select_camera_btn.clicked.connect(self.select_camera)
+            select_layout.addWidget(self.select_camera_btn)
+        
+            self.camera_label = QtWidgets.QLabel("No camera selected")
+            select_layout.addWidget(self.camera_label)
+            camera_layout.addLayout(select_layout)
+        
+            camera_group.setLayout(camera_layout)
+            main_layout.addWidget(camera_group)
+        
+            # Frame Range Group
+            range_group = QtWidgets.QGroupBox("🎬 Frame Range")
+            range_layout = QtWidgets.QVBoxLayout()
+        
+            # FPS info display
+            fps_label = QtWidgets.QLabel()
+            fps_label.setText("Please set desired frame range in the Maya timeline.")
+            fps_label.setStyleSheet("color: #888; font-style: italic;")
+            range_layout.addWidget(fps_label)
+        
+            # Start frame
+            start_layout = QtWidgets.QHBoxLayout()
+            start_layout.addWidget(QtWidgets.QLabel("Start Frame:"))
+            self.start_frame = QtWidgets.QSpinBox()
+            self.start_frame.setRange(-999999, 999999)
+            self.start_frame.setValue(1)
+            start_layout.addWidget(self.start_frame)
+            range_layout.addLayout(start_layout)
+        
+            # End frame
+            end_layout = QtWidgets.QHBoxLayout()
+            end_layout.addWidget(QtWidgets.QLabel("End Frame:"))
+            self.end_frame = QtWidgets.QSpinBox()
+            self.end_frame.setRange(-999999, 999999)
+            self.end_frame.setValue(100)
+            end_layout.addWidget(self.end_frame)
+            range_layout.addLayout(end_layout)
+        
+            # Get from timeline button
+            timeline_btn = QtWidgets.QPushButton("⏱️ Get from Timeline")
+            timeline_btn.setStyleSheet("background-color: rgb(179, 138, 188); color: black;")
+            timeline_btn.clicked.connect(self.load_timeline_range)
+            range_layout.addWidget(timeline_btn)
+        
+            range_group.setLayout(range_layout)
+            main_layout.addWidget(range_group)
+        
+            # Output File Group
+            output_group = QtWidgets.QGroupBox("💾 Output File")
+            output_layout = QtWidgets.QVBoxLayout()
+        
+            file_layout = QtWidgets.QHBoxLayout()
+            self.output_path = QtWidgets.QLineEdit()
+            self.output_path.setPlaceholderText("Select output path...")
+            file_layout.addWidget(self.output_path)
+        
+            browse_btn = QtWidgets.QPushButton("Browse...")
+            browse_btn.setStyleSheet("background-color: rgb(179, 138, 188); color: black;")
+            browse_btn.clicked.connect(self.browse_output)
+            file_layout.addWidget(browse_btn)
+            output_layout.addLayout(file_layout)
+        
+            output_group.setLayout(output_layout)
+            main_layout.addWidget(output_group)
+        
+            # Export Button
+            export_btn = QtWidgets.QPushButton("🚀 Export Camera to USD")
+            export_btn.setMinimumHeight(40)
+            export_btn.setStyleSheet("background-color: rgb(96, 201, 80); color: black; font-weight: bold;")
+            export_btn.clicked.connect(self.export_camera)
+            main_layout.addWidget(export_btn)
+        
+            # Status label
+            self.status_label = QtWidgets.QLabel("")
+            self.status_label.setAlignment(QtCore.Qt.AlignCenter)
+            self.status_label.setWordWrap(True)
+            main_layout.addWidget(self.status_label)
+        
+            # Add stretch at bottom
+            main_layout.addStretch()
+    
+        def populate_cameras(self):
+            """Fill the camera dropdown from the scene."""
+            # One ls + one listRelatives for the whole scene - passing the
+            # full shape list keeps this at two Maya commands instead of
+            # one per camera. Full paths keep duplicate names unambiguous.
+            cam_shapes = mc.ls(type='camera', long=True) or []
+            cam_transforms = mc.listRelatives(cam_shapes, parent=True, fullPath=True) or [] \
+                if cam_shapes else []
+
+            # Multiple shapes under one transform yield duplicate parents;
+            # dict.fromkeys is an order-preserving dedupe that runs in C
+            unique_cams = list(dict.fromkeys(cam_transforms))
+
+            # Refresh is cheap to query but the widget rebuild is not -
+            # skip clear/addItems entirely when nothing changed, which is
+            # the common case for the manual refresh button
+            if unique_cams == self._camera_list_cache:
+                return
+            self._camera_list_cache = unique_cams
+
+            self.camera_combo.blockSignals(True)
+            self.camera_combo.clear()
+            self.camera_combo.addItems(unique_cams)
+            self.camera_combo.blockSignals(False)
+
+            # Keep an existing choice if it survived the refresh
+            if self.selected_camera in unique_cams:
+                self.camera_combo.setCurrentIndex(unique_cams.index(self.selected_camera))
+            elif unique_cams:
+                self.camera_chosen(self.camera_combo.currentText())
+
+        def camera_chosen(self, camera_name):
+            """Track dropdown selection."""
+            if not camera_name:
+                return
+            self.selected_camera = camera_name
+            self.camera_label.setText(f"Camera: {camera_name}")
+
+        def select_camera(self):
+            """Select camera from scene selection."""
+            # Full paths to match the dropdown entries, which are populated
+            # with fullPath=True - short names would never findText() there
+            selection = mc.ls(selection=True, cameras=False, transforms=True, long=True)
+        
+            if not selection:
+                self.status_label.setText("❌ Please select a camera in the scene")
+                self.status_label.setStyleSheet("color: red;")
+                return
+        
+            # Check if selected object has a camera shape
+            shapes = mc.listRelatives(selection[0], shapes=True, type='camera')
+            if not shapes:
+                self.status_label.setText("❌ Selected object is not a camera")
+                self.status_label.setStyleSheet("color: red;")
+                return
+        
+            self.selected_camera = selection[0]
+            self.camera_label.setText(f"Camera: {self.selected_camera}")
+
+            # Mirror the pick into the dropdown
+            index = self.camera_combo.findText(self.selected_camera)
+            if index != -1:
+                self.camera_combo.setCurrentIndex(index)
+
+            self.status_label.setText("✓ Camera selected")
+            self.status_label.setStyleSheet("color: green;")
         
-        mc.inViewMessage(amg=f"Timeline range loaded: {start}-{end}", pos='topCenter', fade=True)
+            mc.inViewMessage(amg=f"Camera set: {self.selected_camera}", pos='topCenter', fade=True)
     
-    def browse_output(self):
-        """Browse for output file location."""
-        file_path = mc.fileDialog2(
-            fileMode=0,
-            caption="Save Camera USD",
-            fileFilter="USD ASCII (*.usda);;All Files (*.*)",
-            dialogStyle=2
-        )
+        def load_timeline_range(self):
+            """Load frame range from Maya timeline."""
+            start = int(mc.playbackOptions(query=True, minTime=True))
+            end = int(mc.playbackOptions(query=True, maxTime=True))
+            self.start_frame.setValue(start)
+            self.end_frame.setValue(end)
         
-        if file_path:
-            self.output_path.setText(file_path[0])
+            mc.inViewMessage(amg=f"Timeline range loaded: {start}-{end}", pos='topCenter', fade=True)
     
-    def export_camera(self):
-        """Export the selected camera to USD."""
-        if not self.selected_camera:
-            self.status_label.setText("❌ Please select a camera first")
-            self.status_label.setStyleSheet("color: red;")
-            return
-        
-        output = self.output_path.text()
-        if not output:
-            self.status_label.setText("❌ Please specify an output path")
-            self.status_label.setStyleSheet("color: red;")
-            return
+        def browse_output(self):
+            """Browse for output file location."""
+            file_path = mc.fileDialog2(
+                fileMode=0,
+                caption="Save Camera USD",
+                fileFilter="USD Binary (*.usdc);;USD ASCII (*.usda);;All Files (*.*)",
+                dialogStyle=2
+            )
         
-        try:
-            # Export camera
-            frame_range = (self.start_frame.value(), self.end_frame.value())
-            result_path = export_camera_to_usd(self.selected_camera, output, frame_range)
+            if file_path:
+                self.output_path.setText(file_path[0])
+    
+        def export_camera(self):
+            """Export the selected camera to USD."""
+            if not self.selected_camera:
+                self.status_label.setText("❌ Please select a camera first")
+                self.status_label.setStyleSheet("color: red;")
+                return
+        
+            output = self.output_path.text()
+            if not output:
+                self.status_label.setText("❌ Please specify an output path")
+                self.status_label.setStyleSheet("color: red;")
+                return
+        
+            try:
+                # Export camera
+                frame_range = (self.start_frame.value(), self.end_frame.value())
+                result_path = export_camera_to_usd(self.selected_camera, output, frame_range)
             
-            # Success
-            self.status_label.setText(f"✓ Camera exported successfully!\n{result_path}")
-            self.status_label.setStyleSheet("color: green;")
+                # Success
+                self.status_label.setText(f"✓ Camera exported successfully!\n{result_path}")
+                self.status_label.setStyleSheet("color: green;")
             
-            mc.inViewMessage(
-                amg=f"Camera exported successfully: {result_path}",
-                pos='topCenter',
-                fade=True
-            )
+                mc.inViewMessage(
+                    amg=f"Camera exported successfully: {result_path}",
+                    pos='topCenter',
+                    fade=True
+                )
             
-        except Exception as e:
-            self.status_label.setText(f"❌ Export failed: {str(e)}")
-            self.status_label.setStyleSheet("color: red;")
-            mc.warning(f"CameraLink export error: {str(e)}")
+            except Exception as e:
+                self.status_label.setText(f"❌ Export failed: {str(e)}")
+                self.status_label.setStyleSheet("color: red;")
+                mc.warning(f"CameraLink export error: {str(e)}")
+
+    _UI_CLASS = CameraLinkUI
+    return CameraLinkUI
 
 def show_ui():
     """Launch CameraLink UI as a dockable workspace control."""
+    from PySide6 import QtWidgets
+    from shiboken6 import wrapInstance
+
     # Delete existing UI if it exists
     if mc.workspaceControl("CameraLinkWC", exists=True):
         mc.deleteUI("CameraLinkWC", control=True)
@@ -398,10 +741,12 @@ def show_ui():
     workspace_widget = wrapInstance(int(workspace_ptr), QtWidgets.QWidget)
     
     # Create and add our UI
-    ui = CameraLinkUI(parent=workspace_widget)
+    ui = _get_ui_class()(parent=workspace_widget)
     workspace_widget.layout().addWidget(ui)
     
     return ui
 
-# Launch the UI
-show_ui()
\ No newline at end of file
+# Launch the UI when run from the Script Editor; importing the module
+# (e.g. for headless/batch export) stays side-effect free.
+if __name__ == "__main__":
+    show_ui()
\ No newline at end of file